@@ -0,0 +1,25 @@
+# engines/common.py
+from typing import Any, Dict, List, Tuple
+
+def w2_totals(w2s: List[Dict], wages_key: str, withheld_key: str) -> Tuple[float, float]:
+    """
+    Sum wages and withholding across all W-2s in a single pass.
+    Missing / blank values count as 0.
+    """
+    wages = 0
+    withheld = 0
+    for w in w2s:
+        wages += float(w.get(wages_key, 0) or 0)
+        withheld += float(w.get(withheld_key, 0) or 0)
+    return wages, withheld
+
+def count_dependents(deps: Any) -> int:
+    """
+    Number of dependents from taxpayer["dependents"].
+    Accepts a list of dependent dicts or a plain int count; anything else is 0.
+    """
+    if isinstance(deps, list):
+        return len(deps)
+    if isinstance(deps, int):
+        return max(deps, 0)
+    return 0
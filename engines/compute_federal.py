@@ -6,14 +6,15 @@ Later you’ll expand this to full line-by-line logic.
 # engines/compute_federal.py
 from typing import Dict, List
 
+from engines.common import w2_totals
+
 def compute_federal(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
     Federal 1040 computation engine (stub for testing).
     Uses wages + federal_withheld from your sample CSVs.
     """
 
-    wages = sum(float(w.get("wages", 0) or 0) for w in w2s)
-    withheld = sum(float(w.get("federal_withheld", 0) or 0) for w in w2s)
+    wages, withheld = w2_totals(w2s, "wages", "federal_withheld")
 
     tax = wages * 0.10  # TEMP: 10% flat tax
     refund = max(withheld - tax, 0)
@@ -1,6 +1,17 @@
 # engines/compute_federal_full.py
 from typing import Dict, List
 
+from engines.common import count_dependents, w2_totals
+
+# Standard deduction by filing status (built once, not per call)
+STD_DED = {
+    "single": 13850,
+    "married_joint": 27700,
+    "married_separate": 13850,
+    "head_household": 20800,
+    "qual_widow": 27700,
+}
+
 def compute_federal(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
     Federal 1040 computation engine (Phase 2+).
@@ -8,17 +19,10 @@ def compute_federal(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
 
     # --- Robust dependents handling (accept list or int) ---
-    deps = taxpayer.get("dependents", [])
-    if isinstance(deps, int):
-        # Coerce to a list of empty dependent shells with that length
-        deps = [{"first": "", "last": "", "ssn": "", "digits": []} for _ in range(deps)]
-    elif not isinstance(deps, list):
-        deps = []
-    num_dependents = len(deps)
+    num_dependents = count_dependents(taxpayer.get("dependents", []))
 
     # --- Income sources ---
-    wages = sum(float(w.get("wages", 0) or 0) for w in w2s)
-    fed_withheld = sum(float(w.get("federal_withheld", 0) or 0) for w in w2s)
+    wages, fed_withheld = w2_totals(w2s, "wages", "federal_withheld")
 
     interest = float(taxpayer.get("interest", 0) or 0)
     dividends = float(taxpayer.get("dividends", 0) or 0)
@@ -42,14 +46,7 @@ def compute_federal(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
 
     # --- Standard deduction ---
     filing_status = taxpayer.get("filing_status", "single")
-    std_deductions = {
-        "single": 13850,
-        "married_joint": 27700,
-        "married_separate": 13850,
-        "head_household": 20800,
-        "qual_widow": 27700,
-    }
-    deduction = std_deductions.get(filing_status, 13850)
+    deduction = STD_DED.get(filing_status, STD_DED["single"])
 
     taxable_income = max(agi - deduction, 0)
 
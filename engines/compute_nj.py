@@ -1,6 +1,8 @@
 # engines/compute_nj.py
 from typing import Dict, List
 
+from engines.common import w2_totals
+
 def compute_nj(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
     NJ computation engine (stub for testing only).
@@ -12,8 +14,7 @@ def compute_nj(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
 
     # Sum wages and NJ withholding from all W-2s
-    wages = sum(float(w.get("wages", 0) or 0) for w in w2s)
-    withheld = sum(float(w.get("nj_withheld", 0) or 0) for w in w2s)
+    wages, withheld = w2_totals(w2s, "wages", "nj_withheld")
 
     # Optional exemptions from taxpayer CSV
     exemptions = float(taxpayer.get("exemptions", 0) or 0)
@@ -1,6 +1,8 @@
 # engines/compute_nj_full.py
 from typing import Dict, List
 
+from engines.common import count_dependents, w2_totals
+
 def compute_nj(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
     NJ-1040 computation engine (Phase 2+).
@@ -8,16 +10,10 @@ def compute_nj(taxpayer: Dict, w2s: List[Dict]) -> Dict[str, float]:
     """
 
     # --- Robust dependents handling (accept list or int) ---
-    deps = taxpayer.get("dependents", [])
-    if isinstance(deps, int):
-        deps = [{"first": "", "last": "", "ssn": "", "digits": []} for _ in range(deps)]
-    elif not isinstance(deps, list):
-        deps = []
-    num_dependents = len(deps)
+    num_dependents = count_dependents(taxpayer.get("dependents", []))
 
     # --- Income sources ---
-    nj_wages = sum(float(w.get("nj_wages", 0) or 0) for w in w2s)
-    nj_withheld = sum(float(w.get("nj_withheld", 0) or 0) for w in w2s)
+    nj_wages, nj_withheld = w2_totals(w2s, "nj_wages", "nj_withheld")
 
     other_income = float(taxpayer.get("other_income", 0) or 0)
     total_income = nj_wages + other_income
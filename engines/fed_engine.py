@@ -6,7 +6,7 @@
 # a neat summary + the 2024 Form 1040 line map. Optionally writes JSON.
 
 import csv, json, re, sys
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 # ---- import your engine ----
 try:
@@ -17,9 +17,10 @@ except Exception as e:
 
 ALLOWED_FS = {FS_SINGLE, FS_MFJ, FS_MFS, FS_HOH, FS_QW}
 
-SSN_RE = re.compile(r"^\d{3}-\d{2}-\d{4}$")
-ZIP_RE = re.compile(r"^\d{5}(-\d{4})?$")
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
+# Whole-value patterns: use .fullmatch (no ^/$ anchors needed)
+SSN_RE = re.compile(r"\d{3}-\d{2}-\d{4}")
+ZIP_RE = re.compile(r"\d{5}(?:-\d{4})?")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")  # YYYY-MM-DD
 
 def to_float(x):
     if x is None: return 0.0
@@ -33,12 +34,51 @@ def to_int(x):
     except:
         return 0
 
+def _text(x):
+    return (x or "").strip()
+
+def _lower_text(x):
+    return (x or "").strip().lower()
+
+# Optional taxpayer columns: (key, caster). Built once, applied per row.
+OPTIONAL_TP_FIELDS = (
+    ("phone", _text),
+    ("email", _text),
+
+    # EITC hooks
+    ("num_qualifying_children", to_int),
+    ("investment_income", to_float),
+
+    # Income outside W-2s
+    ("interest_taxable", to_float),
+    ("dividends_ordinary", to_float),
+    ("dividends_qualified", to_float),
+    ("unemployment_comp", to_float),
+
+    # Adjustments
+    ("student_loan_interest_paid", to_float),
+
+    # Direct deposit (optional)
+    ("bank_routing", _text),
+    ("bank_account", _text),
+    ("deposit_type", _lower_text),
+)
+
+def _data_rows(f) -> Iterator[List[str]]:
+    """
+    csv.reader over f, skipping '#' comment rows. Filtering parsed rows (not
+    raw lines) keeps quoted multi-line fields that contain '#' intact.
+    """
+    return (row for row in csv.reader(f) if not (row and row[0].lstrip().startswith("#")))
+
 def read_taxpayer_csv(path: str) -> Dict:
-    with open(path, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-    if not rows:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = _data_rows(f)
+        header = next(rows, [])
+        first = next((row for row in rows if row), None)
+    if first is None:
         raise ValueError("federal taxpayer CSV is empty")
-    r = rows[0]
+    r = dict(zip(header, first))  # same lookups as a DictReader row
 
     fs = (r.get("filing_status") or "").strip()
     if fs not in ALLOWED_FS:
@@ -51,15 +91,15 @@ def read_taxpayer_csv(path: str) -> Dict:
         return v
 
     primary_ssn = need("primary_ssn", "primary_ssn required (###-##-####)")
-    if not SSN_RE.match(primary_ssn):
+    if not SSN_RE.fullmatch(primary_ssn):
         raise ValueError("primary_ssn must match ###-##-####")
 
     primary_dob = need("primary_dob", "primary_dob required (YYYY-MM-DD)")
-    if not DATE_RE.match(primary_dob):
+    if not DATE_RE.fullmatch(primary_dob):
         raise ValueError("primary_dob must be YYYY-MM-DD")
 
     z = need("zip", "zip (5-digit or ZIP+4)")
-    if not ZIP_RE.match(z):
+    if not ZIP_RE.fullmatch(z):
         raise ValueError("zip must be 5-digit (or ZIP+4)")
 
     # Spouse fields (only if MFJ/MFS/QW)
@@ -72,9 +112,9 @@ def read_taxpayer_csv(path: str) -> Dict:
     if fs in (FS_MFJ, FS_MFS, FS_QW):
         if not spouse_first or not spouse_last or not spouse_ssn or not spouse_dob:
             raise ValueError("spouse_first/last/ssn/dob required for MFJ/MFS/QW")
-        if not SSN_RE.match(spouse_ssn):
+        if not SSN_RE.fullmatch(spouse_ssn):
             raise ValueError("spouse_ssn must match ###-##-####")
-        if not DATE_RE.match(spouse_dob):
+        if not DATE_RE.fullmatch(spouse_dob):
             raise ValueError("spouse_dob must be YYYY-MM-DD")
         if fs == FS_QW and not spouse_deceased_year:
             raise ValueError("spouse_deceased_year required for QW")
@@ -95,38 +135,34 @@ def read_taxpayer_csv(path: str) -> Dict:
         "spouse_ssn":   spouse_ssn,
         "spouse_dob":   spouse_dob,
         "spouse_deceased_year": spouse_deceased_year,
-
-        "phone": (r.get("phone") or "").strip(),
-        "email": (r.get("email") or "").strip(),
-
-        # EITC hooks
-        "num_qualifying_children": to_int(r.get("num_qualifying_children")),
-        "investment_income": to_float(r.get("investment_income")),
-
-        # Income outside W-2s
-        "interest_taxable": to_float(r.get("interest_taxable")),
-        "dividends_ordinary": to_float(r.get("dividends_ordinary")),
-        "dividends_qualified": to_float(r.get("dividends_qualified")),
-        "unemployment_comp": to_float(r.get("unemployment_comp")),
-
-        # Adjustments
-        "student_loan_interest_paid": to_float(r.get("student_loan_interest_paid")),
-
-        # Direct deposit (optional)
-        "bank_routing": (r.get("bank_routing") or "").strip(),
-        "bank_account": (r.get("bank_account") or "").strip(),
-        "deposit_type": (r.get("deposit_type") or "").strip().lower(),
     }
+    get = r.get
+    tp.update({k: cast(get(k)) for k, cast in OPTIONAL_TP_FIELDS})
 
     return tp
 
+def _column_map(header: List[str]) -> Dict[str, int]:
+    """Map column name -> position (last one wins, like DictReader)."""
+    return {name: i for i, name in enumerate(header)}
+
+def _cell(row: List, i):
+    """Value at column index i, or None when the column is missing or the row is short."""
+    return row[i] if i is not None and i < len(row) else None
+
 def read_w2_csv(path: str) -> List[Dict]:
     out = []
-    with open(path, newline="", encoding="utf-8") as f:
-        for r in csv.DictReader(f):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = _data_rows(f)
+        header = next(rows, [])
+        cols = _column_map(header)
+        i_wages = cols.get("wages_box1")
+        i_fed   = cols.get("fed_withheld_box2")
+        for row in rows:
+            if not row:
+                continue
             out.append({
-                "wages_box1": to_float(r.get("wages_box1")),
-                "fed_withheld_box2": to_float(r.get("fed_withheld_box2")),
+                "wages_box1": to_float(_cell(row, i_wages)),
+                "fed_withheld_box2": to_float(_cell(row, i_fed)),
             })
     if not out:
         raise ValueError("W-2 CSV is empty")
@@ -134,19 +170,43 @@ def read_w2_csv(path: str) -> List[Dict]:
 
 def read_dependents_csv(path: str) -> List[Dict]:
     out = []
-    with open(path, newline="", encoding="utf-8") as f:
-        for r in csv.DictReader(f):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = _data_rows(f)
+        header = next(rows, [])
+        cols = _column_map(header)
+        i_first = cols.get("first")
+        i_last  = cols.get("last")
+        i_ssn   = cols.get("ssn")
+        i_dob   = cols.get("dob")
+        i_rel   = cols.get("relationship")
+        i_mos   = cols.get("months_lived_with_you")
+        i_u17   = cols.get("child_under_17")
+        for row in rows:
+            if not row:
+                continue
             out.append({
-                "first": (r.get("first") or "").strip(),
-                "last":  (r.get("last") or "").strip(),
-                "ssn":   (r.get("ssn") or "").strip(),
-                "dob":   (r.get("dob") or "").strip(),
-                "relationship": (r.get("relationship") or "").strip(),
-                "months_lived_with_you": to_int(r.get("months_lived_with_you")),
-                "child_under_17": str(r.get("child_under_17") or "").strip().lower() in {"true","1","yes","y"},
+                "first": (_cell(row, i_first) or "").strip(),
+                "last":  (_cell(row, i_last) or "").strip(),
+                "ssn":   (_cell(row, i_ssn) or "").strip(),
+                "dob":   (_cell(row, i_dob) or "").strip(),
+                "relationship": (_cell(row, i_rel) or "").strip(),
+                "months_lived_with_you": to_int(_cell(row, i_mos)),
+                "child_under_17": str(_cell(row, i_u17) or "").strip().lower() in {"true","1","yes","y"},
             })
     return out
 
+LINE_KEY_RE = re.compile(r"^(\d+)([a-z]*)$")
+
+def _parse_line_key(k: str):
+    m = LINE_KEY_RE.match(k)
+    if not m: return (9999, k)
+    num = int(m.group(1))
+    suf = m.group(2)
+    add = 0.0
+    if suf:
+        add = (ord(suf[0]) - ord('a') + 1) / 10.0
+    return (num + add, k)
+
 def main():
     tp_csv = sys.argv[1] if len(sys.argv) > 1 else "federal_taxpayer_template.csv"
     w2_csv = sys.argv[2] if len(sys.argv) > 2 else "nj_w2_template.csv"
@@ -188,18 +248,8 @@ def main():
         print(f" Amount Owed(37): ${out['37']:,}")
 
     # Print line map sorted by line order (handles 1z, 2b, etc.)
-    def sort_key(k: str):
-        m = re.match(r"^(\d+)([a-z]*)$", k)
-        if not m: return (9999, k)
-        num = int(m.group(1))
-        suf = m.group(2)
-        add = 0.0
-        if suf:
-            add = (ord(suf[0]) - ord('a') + 1) / 10.0
-        return (num + add, k)
-
     print("\n--- 1040 LINE MAP ---")
-    for k in sorted([kk for kk in out.keys() if not kk.startswith("_")], key=sort_key):
+    for k in sorted([kk for kk in out.keys() if not kk.startswith("_")], key=_parse_line_key):
         print(f" Line {k:>3}: {out[k]}")
 
     if out_json:
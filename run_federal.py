@@ -4,14 +4,11 @@ import sys
 import csv
 import json
 # Toggle: set USE_STUB_FED=1 to use the stub; anything else uses full logic
-if os.getenv("USE_STUB_FED", "0") == "1":
-    from engines.compute_federal import compute_federal          # <-- your existing STUB
-else:
-    from engines.compute_federal_full import compute_federal     # <-- NEW full version
-
-
 try:
-    from engines.compute_federal import compute_federal
+    if os.getenv("USE_STUB_FED", "0") == "1":
+        from engines.compute_federal import compute_federal          # <-- your existing STUB
+    else:
+        from engines.compute_federal_full import compute_federal     # <-- NEW full version
 except Exception as e:
     print("Import error for engines.compute_federal:", e)
     sys.exit(1)
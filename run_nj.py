@@ -3,13 +3,11 @@ import sys
 import csv
 import json
 # Toggle: set USE_STUB_NJ=1 to use the stub; anything else uses full logic
-if os.getenv("USE_STUB_NJ", "0") == "1":
-    from engines.compute_nj import compute_nj                    # <-- your existing STUB
-else:
-    from engines.compute_nj_full import compute_nj               # <-- NEW full version
-
 try:
-    from engines.compute_nj import compute_nj
+    if os.getenv("USE_STUB_NJ", "0") == "1":
+        from engines.compute_nj import compute_nj                    # <-- your existing STUB
+    else:
+        from engines.compute_nj_full import compute_nj               # <-- NEW full version
 except Exception as e:
     print("Import error for engines.compute_nj:", e)
     sys.exit(1)
@@ -39,12 +37,12 @@ def main():
 
     result = compute_nj(taxpayer, w2s)
 
-    # Try common keys; fall back to printing the dict
-    wages    = result.get("wages", result.get("nj_wages"))
-    tax      = result.get("tax", result.get("tax_due", result.get("total_tax")))
-    withheld = result.get("withheld", result.get("nj_withheld"))
-    refund   = result.get("refund", result.get("overpayment"))
-    owed     = result.get("balance_due", result.get("amount_owed"))
+    # Try common keys (stub names, then NJ-1040 line numbers); fall back to printing the dict
+    wages    = result.get("wages", result.get("nj_wages", result.get("1")))
+    tax      = result.get("tax", result.get("tax_due", result.get("total_tax", result.get("16"))))
+    withheld = result.get("withheld", result.get("nj_withheld", result.get("19")))
+    refund   = result.get("refund", result.get("overpayment", result.get("65")))
+    owed     = result.get("balance_due", result.get("amount_owed", result.get("66")))
 
     print("=== NJ Summary ===")
     if any(v is not None for v in [wages, tax, withheld, refund, owed]):
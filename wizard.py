@@ -1,7 +1,15 @@
 # wizard.py — console wizard with Review/Edit and money digit arrays
+# Usage:
+#   python wizard.py                      (interactive)
+#   python wizard.py --from session.json  (no prompts; e.g. a previous out/out_f1040.json)
+#   python wizard.py --batch returns.jsonl (one session per line -> out/batch_*.jsonl)
 from __future__ import annotations
-import os, sys, json
-from typing import Dict, List
+import os, re, sys
+from typing import Dict, List, Sequence
+try:
+    import readline  # noqa: F401  -- line editing for input(); no 4095-char paste cap
+except ImportError:  # Windows without pyreadline3
+    pass
 
 # ---------- small input helpers ----------
 
@@ -9,6 +17,19 @@ def prompt(label: str, default: str = "") -> str:
     ans = input(f"{label} [{default}]: ").strip()
     return ans if ans else default
 
+# Whole-value formats (checked with .fullmatch)
+SSN_RE = re.compile(r"\d{3}-\d{2}-\d{4}")   # 123-45-6789
+DOB_RE = re.compile(r"\d{2}/\d{2}/\d{4}")   # MM/DD/YYYY
+
+def prompt_matching(label: str, pattern: re.Pattern, default: str = "") -> str:
+    """Like prompt(), but re-asks until the answer matches pattern (blank keeps default)."""
+    text = f"{label} [{default}]: "
+    while True:
+        ans = input(text).strip()
+        if not ans or pattern.fullmatch(ans):
+            return ans if ans else default
+        print("  Please use the format shown.")
+
 def prompt_yesno(label: str, default_no: bool = False) -> bool:
     default_letter = "n" if default_no else "y"
     ans = input(f"{label} (y/n) [{default_letter}]: ").strip().lower()
@@ -24,29 +45,31 @@ def _to_float_money(raw: str) -> float:
     return float(s) if s else 0.0
 
 def prompt_money(label: str, default: float = 0.0) -> float:
-    ans = input(f"{label} [{default}]: ").strip()
-    if ans == "":
-        return float(default)
-    try:
-        return _to_float_money(ans)
-    except ValueError:
-        print("  Please enter a number (e.g., 1,234.56 or ($123.45)).")
-        return prompt_money(label, default)
+    text = f"{label} [{default}]: "  # built once, reused on retries
+    while True:
+        ans = input(text).strip()
+        if ans == "":
+            return float(default)
+        try:
+            return _to_float_money(ans)
+        except ValueError:
+            print("  Please enter a number (e.g., 1,234.56 or ($123.45)).")
 
 def prompt_int(label: str, default: int = 0) -> int:
-    ans = input(f"{label} [{default}]: ").strip().replace(",", "")
-    if ans == "":
-        return default
-    try:
-        return int(float(ans))
-    except ValueError:
-        print("  Please enter a whole number.")
-        return prompt_int(label, default)
+    text = f"{label} [{default}]: "
+    while True:
+        ans = input(text).strip().replace(",", "")
+        if ans == "":
+            return default
+        try:
+            return int(float(ans))
+        except ValueError:
+            print("  Please enter a whole number.")
 
-def prompt_choice(label: str, options: List[str], default: str) -> str:
-    opts = ", ".join(options)
+def prompt_choice(label: str, options: Sequence[str], default: str) -> str:
+    text = f"{label} [{default}]\n  Please choose one of: {', '.join(options)}\n> "
     while True:
-        ans = input(f"{label} [{default}]\n  Please choose one of: {opts}\n> ").strip().lower()
+        ans = input(text).strip().lower()
         if not ans:
             return default
         if ans in options:
@@ -54,10 +77,15 @@ def prompt_choice(label: str, options: List[str], default: str) -> str:
         print("  Invalid choice, try again.")
 
 def digits_list(raw: str) -> List[str]:
-    return [c for c in str(raw) if c.isdigit()]
+    s = str(raw)
+    if s.isdigit():  # already clean (ZIP, routing, account): no filtering needed
+        return list(s)
+    return [c for c in s if c.isdigit()]
 
 # ---------- money → digit arrays ----------
 
+_CENTS = tuple(f"{c:02d}" for c in range(100))  # "00".."99"
+
 def money_to_digits(amount: float, dollar_pad: int = 9) -> (List[str], List[str]):
     """
     Convert 1234.56 -> (['0','0','0','0','1','2','3','4'], ['5','6']) with pad=8
@@ -68,42 +96,52 @@ def money_to_digits(amount: float, dollar_pad: int = 9) -> (List[str], List[str]
         val = float(amount)
     except Exception:
         val = 0.0
+    if not val:  # blank/defaulted fields are the common case
+        return ["0"] * (dollar_pad if dollar_pad > 1 else 1), ["0", "0"]
     val_abs = abs(val)
     dollars = int(val_abs)  # floor toward zero
-    cents = int(round((val_abs - dollars) * 100))  # rounded cents
+    cents = round((val_abs - dollars) * 100)  # rounded cents (an int)
     if cents == 100:  # handle 1.9999 -> 2.00 rounding edge
         dollars += 1
         cents = 0
-    d_str = f"{dollars:0{dollar_pad}d}"
-    c_str = f"{cents:02d}"
-    return list(d_str), list(c_str)
+    return list(str(dollars).zfill(dollar_pad)), list(_CENTS[cents])
 
 def set_money(obj: Dict, key: str, value: float, pad: int = 9):
     """Store numeric and digits arrays side-by-side on obj."""
-    obj[key] = float(value or 0.0)
-    d, c = money_to_digits(obj[key], pad)
+    new = float(value or 0.0)
+    old = obj.get(key)
+    if type(old) is float and old == new and len(obj.get(f"{key}_digits", ())) == pad:
+        return  # accepted default on an edit pass: arrays are already current
+    obj[key] = new
+    d, c = money_to_digits(new, pad)
     obj[f"{key}_digits"] = d
     obj[f"{key}_cents_digits"] = c
 
 # ---------- collect sections ----------
 
+# Choice lists shared by the collect and edit prompts (built once)
+FILING_STATUSES  = ("single", "married_joint", "married_separate", "head_household", "qual_widow")
+HOUSING_STATUSES = ("homeowner", "tenant", "both")
+ACCOUNT_TYPES    = ("checking", "savings")
+W2_MENU          = ("add", "edit", "delete", "done")
+
 def collect_personal_info() -> Dict:
     print("\n=== Basic Personal Info ===")
     tp: Dict = {}
     tp["first"] = prompt("First name")
     tp["last"]  = prompt("Last name")
-    ssn_raw     = prompt("SSN (123-45-6789)")
+    ssn_raw     = prompt_matching("SSN (123-45-6789)", SSN_RE)
     tp["ssn"]   = ssn_raw
     tp["ssn_digits"] = digits_list(ssn_raw)
 
-    dob_raw     = prompt("Date of Birth (MM/DD/YYYY)")
+    dob_raw     = prompt_matching("Date of Birth (MM/DD/YYYY)", DOB_RE)
     tp["dob"]   = dob_raw
     tp["dob_digits"] = digits_list(dob_raw)
 
     tp["email"] = prompt("Email (optional)")
     tp["filing_status"] = prompt_choice(
         "Filing status",
-        ["single", "married_joint", "married_separate", "head_household", "qual_widow"],
+        FILING_STATUSES,
         "single",
     )
 
@@ -131,8 +169,8 @@ def collect_dependents() -> List[Dict]:
     while True:
         first = prompt("  Dependent first name")
         last  = prompt("  Dependent last name")
-        ssn   = prompt("  Dependent SSN (123-45-6789)")
-        dob   = prompt("  Dependent DOB (MM/DD/YYYY)")
+        ssn   = prompt_matching("  Dependent SSN (123-45-6789)", SSN_RE)
+        dob   = prompt_matching("  Dependent DOB (MM/DD/YYYY)", DOB_RE)
         rel   = prompt("  Relationship to you")
         deps.append({
             "first": first,
@@ -147,6 +185,20 @@ def collect_dependents() -> List[Dict]:
             break
     return deps
 
+# Money boxes stored on every W-2 dict (each also gets *_digits arrays):
+# (key, collect prompt, edit prompt)
+W2_MONEY_FIELDS = (
+    ("wages",            "  Box 1 – Wages",                         "  Box 1 – Wages"),
+    ("federal_withheld", "  Box 2 – Federal income tax withheld",   "  Box 2 – Fed income tax withheld"),
+    ("ss_wages",         "  Box 3 – Social Security wages",         "  Box 3 – SS wages"),
+    ("ss_tax",           "  Box 4 – Social Security tax withheld",  "  Box 4 – SS tax withheld"),
+    ("medicare_wages",   "  Box 5 – Medicare wages",                "  Box 5 – Medicare wages"),
+    ("medicare_tax",     "  Box 6 – Medicare tax",                  "  Box 6 – Medicare tax"),
+    ("nj_wages",         "  Box 16 – NJ wages",                     "  Box 16 – NJ wages"),
+    ("nj_withheld",      "  Box 17 – NJ income tax withheld",       "  Box 17 – NJ tax withheld"),
+)
+W2_MONEY_KEYS = tuple(key for key, _, _ in W2_MONEY_FIELDS)
+
 def collect_w2s() -> List[Dict]:
     w2s: List[Dict] = []
     print("\n=== W-2 Income ===")
@@ -157,53 +209,40 @@ def collect_w2s() -> List[Dict]:
         w: Dict = {}
         w["employer"] = prompt("Employer name")
 
-        set_money(w, "wages",            prompt_money("  Box 1 – Wages"))
-        set_money(w, "federal_withheld", prompt_money("  Box 2 – Federal income tax withheld"))
-        set_money(w, "ss_wages",         prompt_money("  Box 3 – Social Security wages", 0.0))
-        set_money(w, "ss_tax",           prompt_money("  Box 4 – Social Security tax withheld", 0.0))
-        set_money(w, "medicare_wages",   prompt_money("  Box 5 – Medicare wages", 0.0))
-        set_money(w, "medicare_tax",     prompt_money("  Box 6 – Medicare tax", 0.0))
-        set_money(w, "nj_wages",         prompt_money("  Box 16 – NJ wages"))
-        set_money(w, "nj_withheld",      prompt_money("  Box 17 – NJ income tax withheld"))
+        for key, label, _ in W2_MONEY_FIELDS:
+            set_money(w, key, prompt_money(label))
 
         w2s.append(w)
         if not prompt_yesno("Add another W-2?"):
             break
     return w2s
 
+# Other-income questions: (yes/no question, ((key, amount prompt), ...))
+OTHER_INCOME_QUESTIONS = (
+    ("Any bank interest (1099-INT)?",
+     (("interest", "  1099-INT Box 1 – Interest"),)),
+    ("Any dividends (1099-DIV)?",
+     (("dividends", "  1099-DIV Box 1a – Ordinary dividends"),)),
+    ("Any unemployment income (1099-G)?",
+     (("unemployment", "  1099-G Box 1 – Unemployment"),)),
+    ("Any 1099-NEC self-employment income?",
+     (("nec_income",   "  1099-NEC Box 1 – Gross income"),
+      ("nec_expenses", "  1099-NEC Expenses"))),
+    ("Any Social Security benefits (SSA-1099)?",
+     (("ssa_benefits", "  SSA-1099 Box 5 – Net benefits"),)),
+    ("Any pension/IRA distributions (1099-R)?",
+     (("pension", "  1099-R Box 1 – Gross distribution"),)),
+)
+
 def collect_other_income(tp: Dict):
     print("\n=== Other Income (optional) ===")
-    if prompt_yesno("Any bank interest (1099-INT)?"):
-        set_money(tp, "interest", prompt_money("  1099-INT Box 1 – Interest"))
-    else:
-        set_money(tp, "interest", 0.0)
-
-    if prompt_yesno("Any dividends (1099-DIV)?"):
-        set_money(tp, "dividends", prompt_money("  1099-DIV Box 1a – Ordinary dividends"))
-    else:
-        set_money(tp, "dividends", 0.0)
-
-    if prompt_yesno("Any unemployment income (1099-G)?"):
-        set_money(tp, "unemployment", prompt_money("  1099-G Box 1 – Unemployment"))
-    else:
-        set_money(tp, "unemployment", 0.0)
-
-    if prompt_yesno("Any 1099-NEC self-employment income?"):
-        set_money(tp, "nec_income",   prompt_money("  1099-NEC Box 1 – Gross income"))
-        set_money(tp, "nec_expenses", prompt_money("  1099-NEC Expenses", 0.0))
-    else:
-        set_money(tp, "nec_income",   0.0)
-        set_money(tp, "nec_expenses", 0.0)
-
-    if prompt_yesno("Any Social Security benefits (SSA-1099)?"):
-        set_money(tp, "ssa_benefits", prompt_money("  SSA-1099 Box 5 – Net benefits"))
-    else:
-        set_money(tp, "ssa_benefits", 0.0)
-
-    if prompt_yesno("Any pension/IRA distributions (1099-R)?"):
-        set_money(tp, "pension", prompt_money("  1099-R Box 1 – Gross distribution"))
-    else:
-        set_money(tp, "pension", 0.0)
+    for question, fields in OTHER_INCOME_QUESTIONS:
+        if prompt_yesno(question):
+            for key, label in fields:
+                set_money(tp, key, prompt_money(label))
+        else:
+            for key, _ in fields:
+                set_money(tp, key, 0.0)
 
 def collect_adjustments(tp: Dict):
     print("\n=== Adjustments & Deductions (basic) ===")
@@ -224,7 +263,7 @@ def collect_nj_property(tp: Dict):
         tp["landlord_or_owner"]  = ""
         return
     status = prompt_choice("Are you a homeowner, tenant, or both? (homeowner/tenant/both)",
-                           ["homeowner","tenant","both"], "tenant")
+                           HOUSING_STATUSES, "tenant")
     if status in ("tenant","both"):
         set_money(tp, "rent_paid", prompt_money("  NJ rent amount paid", 0.0))
     else:
@@ -246,7 +285,7 @@ def collect_refund_prefs(tp: Dict):
         tp["bank_routing_digits"] = digits_list(routing)
         tp["bank_account"] = account
         tp["bank_account_digits"] = digits_list(account)
-        tp["bank_account_type"] = prompt_choice("Account type", ["checking","savings"], "checking")
+        tp["bank_account_type"] = prompt_choice("Account type", ACCOUNT_TYPES, "checking")
     else:
         tp["direct_deposit"] = False
         tp["bank_routing"] = ""
@@ -258,79 +297,82 @@ def collect_refund_prefs(tp: Dict):
 # ---------- Review & Edit helpers ----------
 
 def show_summary(tp: Dict, w2s: List[Dict]):
-    print("\n=========== REVIEW SUMMARY ===========")
-    print(f"Name: {tp.get('first','')} {tp.get('last','')}")
-    print(f"SSN:  {tp.get('ssn','')}")
-    print(f"DOB:  {tp.get('dob','')}")
-    print(f"Email: {tp.get('email','')}")
-    print(f"Filing status: {tp.get('filing_status','')}")
+    out: List[str] = []  # collected, then written to stdout in one call
+    add = out.append
+    add("\n=========== REVIEW SUMMARY ===========")
+    add(f"Name: {tp.get('first','')} {tp.get('last','')}")
+    add(f"SSN:  {tp.get('ssn','')}")
+    add(f"DOB:  {tp.get('dob','')}")
+    add(f"Email: {tp.get('email','')}")
+    add(f"Filing status: {tp.get('filing_status','')}")
     addr = tp.get("address", {})
-    print("Address:")
-    print(f"  {addr.get('line1','')}")
-    if addr.get("line2"): print(f"  {addr.get('line2')}")
-    print(f"  {addr.get('city','')}, {addr.get('state','')} {addr.get('zip','')}")
-    print(f"NJ full-year resident: {tp.get('nj_full_year_resident', False)}")
-    if tp.get("nj_county"): print(f"NJ County: {tp.get('nj_county')}")
-
-    print("\nDependents:")
+    add("Address:")
+    add(f"  {addr.get('line1','')}")
+    if addr.get("line2"): add(f"  {addr.get('line2')}")
+    add(f"  {addr.get('city','')}, {addr.get('state','')} {addr.get('zip','')}")
+    add(f"NJ full-year resident: {tp.get('nj_full_year_resident', False)}")
+    if tp.get("nj_county"): add(f"NJ County: {tp.get('nj_county')}")
+
+    add("\nDependents:")
     deps = tp.get("dependents", [])
     if not deps:
-        print("  (none)")
+        add("  (none)")
     else:
         for i, d in enumerate(deps, 1):
-            print(f"  {i}. {d.get('first','')} {d.get('last','')} — {d.get('relationship','')} (SSN {d.get('ssn','')})")
+            add(f"  {i}. {d.get('first','')} {d.get('last','')} — {d.get('relationship','')} (SSN {d.get('ssn','')})")
 
-    print("\nW-2s:")
+    add("\nW-2s:")
     if not w2s:
-        print("  (none)")
+        add("  (none)")
     else:
         for i, w in enumerate(w2s, 1):
-            print(f"  {i}. {w.get('employer','')}: "
-                  f"Wages {w.get('wages',0):,.2f}, Fed WH {w.get('federal_withheld',0):,.2f}, "
-                  f"NJ Wages {w.get('nj_wages',0):,.2f}, NJ WH {w.get('nj_withheld',0):,.2f}")
-
-    print("\nOther Income:")
-    print(f"  Interest(1099-INT): {tp.get('interest',0):,.2f}")
-    print(f"  Dividends(1099-DIV): {tp.get('dividends',0):,.2f}")
-    print(f"  Unemployment(1099-G): {tp.get('unemployment',0):,.2f}")
-    print(f"  NEC gross(1099-NEC): {tp.get('nec_income',0):,.2f}  Expenses: {tp.get('nec_expenses',0):,.2f}")
-    print(f"  Social Security(SSA-1099): {tp.get('ssa_benefits',0):,.2f}")
-    print(f"  Pension/IRA(1099-R): {tp.get('pension',0):,.2f}")
-
-    print("\nAdjustments & NJ:")
-    print(f"  Student loan interest: {tp.get('student_loan_interest',0):,.2f}")
-    print(f"  IRA contributions: {tp.get('ira_contributions',0):,.2f}")
-    print(f"  HSA contributions: {tp.get('hsa_contributions',0):,.2f}")
-    print(f"  Rent paid (NJ): {tp.get('rent_paid',0):,.2f}")
-    print(f"  Property tax paid (NJ): {tp.get('property_tax_paid',0):,.2f}")
-    print(f"  Months at property: {tp.get('months_at_property',0)}")
-    if tp.get("landlord_or_owner"): print(f"  Landlord/Owner: {tp.get('landlord_or_owner')}")
-
-    print("\nRefund/Deposit:")
+            add(f"  {i}. {w.get('employer','')}: "
+                f"Wages {w.get('wages',0):,.2f}, Fed WH {w.get('federal_withheld',0):,.2f}, "
+                f"NJ Wages {w.get('nj_wages',0):,.2f}, NJ WH {w.get('nj_withheld',0):,.2f}")
+
+    add("\nOther Income:")
+    add(f"  Interest(1099-INT): {tp.get('interest',0):,.2f}")
+    add(f"  Dividends(1099-DIV): {tp.get('dividends',0):,.2f}")
+    add(f"  Unemployment(1099-G): {tp.get('unemployment',0):,.2f}")
+    add(f"  NEC gross(1099-NEC): {tp.get('nec_income',0):,.2f}  Expenses: {tp.get('nec_expenses',0):,.2f}")
+    add(f"  Social Security(SSA-1099): {tp.get('ssa_benefits',0):,.2f}")
+    add(f"  Pension/IRA(1099-R): {tp.get('pension',0):,.2f}")
+
+    add("\nAdjustments & NJ:")
+    add(f"  Student loan interest: {tp.get('student_loan_interest',0):,.2f}")
+    add(f"  IRA contributions: {tp.get('ira_contributions',0):,.2f}")
+    add(f"  HSA contributions: {tp.get('hsa_contributions',0):,.2f}")
+    add(f"  Rent paid (NJ): {tp.get('rent_paid',0):,.2f}")
+    add(f"  Property tax paid (NJ): {tp.get('property_tax_paid',0):,.2f}")
+    add(f"  Months at property: {tp.get('months_at_property',0)}")
+    if tp.get("landlord_or_owner"): add(f"  Landlord/Owner: {tp.get('landlord_or_owner')}")
+
+    add("\nRefund/Deposit:")
     if tp.get("direct_deposit", False):
-        print(f"  Direct deposit: YES ({tp.get('bank_account_type','checking')})")
-        print(f"  Routing: {tp.get('bank_routing','')}  Account: {tp.get('bank_account','')}")
+        add(f"  Direct deposit: YES ({tp.get('bank_account_type','checking')})")
+        add(f"  Routing: {tp.get('bank_routing','')}  Account: {tp.get('bank_account','')}")
     else:
-        print("  Direct deposit: NO")
-    print("======================================\n")
+        add("  Direct deposit: NO")
+    add("======================================\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def edit_personal(tp: Dict):
     print("\n-- Edit: Personal & Address --")
     tp["first"] = prompt("First name", tp.get("first",""))
     tp["last"]  = prompt("Last name",  tp.get("last",""))
 
-    ssn_raw = prompt("SSN (123-45-6789)", tp.get("ssn",""))
+    ssn_raw = prompt_matching("SSN (123-45-6789)", SSN_RE, tp.get("ssn",""))
     tp["ssn"] = ssn_raw
     tp["ssn_digits"] = digits_list(ssn_raw)
 
-    dob_raw = prompt("Date of Birth (MM/DD/YYYY)", tp.get("dob",""))
+    dob_raw = prompt_matching("Date of Birth (MM/DD/YYYY)", DOB_RE, tp.get("dob",""))
     tp["dob"] = dob_raw
     tp["dob_digits"] = digits_list(dob_raw)
 
     tp["email"] = prompt("Email (optional)", tp.get("email",""))
     tp["filing_status"] = prompt_choice(
         "Filing status",
-        ["single","married_joint","married_separate","head_household","qual_widow"],
+        FILING_STATUSES,
         tp.get("filing_status","single"),
     )
     addr = tp.get("address", {})
@@ -349,14 +391,8 @@ def edit_personal(tp: Dict):
 def edit_one_w2(w: Dict):
     print("\nEditing this W-2:")
     w["employer"] = prompt("  Employer", w.get("employer",""))
-    set_money(w, "wages",            prompt_money("  Box 1 – Wages", w.get("wages",0)))
-    set_money(w, "federal_withheld", prompt_money("  Box 2 – Fed income tax withheld", w.get("federal_withheld",0)))
-    set_money(w, "ss_wages",         prompt_money("  Box 3 – SS wages", w.get("ss_wages",0)))
-    set_money(w, "ss_tax",           prompt_money("  Box 4 – SS tax withheld", w.get("ss_tax",0)))
-    set_money(w, "medicare_wages",   prompt_money("  Box 5 – Medicare wages", w.get("medicare_wages",0)))
-    set_money(w, "medicare_tax",     prompt_money("  Box 6 – Medicare tax", w.get("medicare_tax",0)))
-    set_money(w, "nj_wages",         prompt_money("  Box 16 – NJ wages", w.get("nj_wages",0)))
-    set_money(w, "nj_withheld",      prompt_money("  Box 17 – NJ tax withheld", w.get("nj_withheld",0)))
+    for key, _, label in W2_MONEY_FIELDS:
+        set_money(w, key, prompt_money(label, w.get(key,0)))
 
 def edit_w2s(w2s: List[Dict]):
     while True:
@@ -366,7 +402,7 @@ def edit_w2s(w2s: List[Dict]):
         else:
             for i, w in enumerate(w2s, 1):
                 print(f"  {i}. {w.get('employer','')} — Wages {w.get('wages',0):,.2f}, Fed WH {w.get('federal_withheld',0):,.2f}")
-        choice = prompt_choice("Choose: add, edit, delete, done", ["add","edit","delete","done"], "done")
+        choice = prompt_choice("Choose: add, edit, delete, done", W2_MENU, "done")
         if choice == "done":
             return
         if choice == "add":
@@ -417,65 +453,21 @@ def edit_refund_prefs(tp: Dict):
         tp["bank_routing_digits"] = digits_list(routing)
         tp["bank_account"] = account
         tp["bank_account_digits"] = digits_list(account)
-        tp["bank_account_type"] = prompt_choice("  Account type", ["checking","savings"], tp.get("bank_account_type","checking"))
-
-def show_summary(tp: Dict, w2s: List[Dict]):
-    # (kept same as above)
-    print("\n=========== REVIEW SUMMARY ===========")
-    print(f"Name: {tp.get('first','')} {tp.get('last','')}")
-    print(f"SSN:  {tp.get('ssn','')}")
-    print(f"DOB:  {tp.get('dob','')}")
-    print(f"Email: {tp.get('email','')}")
-    print(f"Filing status: {tp.get('filing_status','')}")
-    addr = tp.get("address", {})
-    print("Address:")
-    print(f"  {addr.get('line1','')}")
-    if addr.get("line2"): print(f"  {addr.get('line2')}")
-    print(f"  {addr.get('city','')}, {addr.get('state','')} {addr.get('zip','')}")
-    print(f"NJ full-year resident: {tp.get('nj_full_year_resident', False)}")
-    if tp.get("nj_county"): print(f"NJ County: {tp.get('nj_county')}")
-
-    print("\nDependents:")
-    deps = tp.get("dependents", [])
-    if not deps:
-        print("  (none)")
-    else:
-        for i, d in enumerate(deps, 1):
-            print(f"  {i}. {d.get('first','')} {d.get('last','')} — {d.get('relationship','')} (SSN {d.get('ssn','')})")
-
-    print("\nW-2s:")
-    if not w2s:
-        print("  (none)")
-    else:
-        for i, w in enumerate(w2s, 1):
-            print(f"  {i}. {w.get('employer','')}: "
-                  f"Wages {w.get('wages',0):,.2f}, Fed WH {w.get('federal_withheld',0):,.2f}, "
-                  f"NJ Wages {w.get('nj_wages',0):,.2f}, NJ WH {w.get('nj_withheld',0):,.2f}")
-
-    print("\nOther Income:")
-    print(f"  Interest(1099-INT): {tp.get('interest',0):,.2f}")
-    print(f"  Dividends(1099-DIV): {tp.get('dividends',0):,.2f}")
-    print(f"  Unemployment(1099-G): {tp.get('unemployment',0):,.2f}")
-    print(f"  NEC gross(1099-NEC): {tp.get('nec_income',0):,.2f}  Expenses: {tp.get('nec_expenses',0):,.2f}")
-    print(f"  Social Security(SSA-1099): {tp.get('ssa_benefits',0):,.2f}")
-    print(f"  Pension/IRA(1099-R): {tp.get('pension',0):,.2f}")
-
-    print("\nAdjustments & NJ:")
-    print(f"  Student loan interest: {tp.get('student_loan_interest',0):,.2f}")
-    print(f"  IRA contributions: {tp.get('ira_contributions',0):,.2f}")
-    print(f"  HSA contributions: {tp.get('hsa_contributions',0):,.2f}")
-    print(f"  Rent paid (NJ): {tp.get('rent_paid',0):,.2f}")
-    print(f"  Property tax paid (NJ): {tp.get('property_tax_paid',0):,.2f}")
-    print(f"  Months at property: {tp.get('months_at_property',0)}")
-    if tp.get("landlord_or_owner"): print(f"  Landlord/Owner: {tp.get('landlord_or_owner')}")
-
-    print("\nRefund/Deposit:")
-    if tp.get("direct_deposit", False):
-        print(f"  Direct deposit: YES ({tp.get('bank_account_type','checking')})")
-        print(f"  Routing: {tp.get('bank_routing','')}  Account: {tp.get('bank_account','')}")
-    else:
-        print("  Direct deposit: NO")
-    print("======================================\n")
+        tp["bank_account_type"] = prompt_choice("  Account type", ACCOUNT_TYPES, tp.get("bank_account_type","checking"))
+
+def edit_dependents(tp: Dict):
+    tp["dependents"] = collect_dependents()
+
+# Edit menu number -> action(tp, w2s); 8 = continue
+EDIT_MENU = {
+    1: lambda tp, w2s: edit_personal(tp),
+    2: lambda tp, w2s: edit_dependents(tp),
+    3: lambda tp, w2s: edit_w2s(w2s),
+    4: lambda tp, w2s: edit_other_income(tp),
+    5: lambda tp, w2s: edit_adjustments(tp),
+    6: lambda tp, w2s: edit_nj_property(tp),
+    7: lambda tp, w2s: edit_refund_prefs(tp),
+}
 
 def review_and_edit(tp: Dict, w2s: List[Dict]):
     while True:
@@ -490,18 +482,16 @@ def review_and_edit(tp: Dict, w2s: List[Dict]):
         print("  7) Refund preferences")
         print("  8) Continue to compute")
         choice = prompt_int("Choose 1–8", 8)
-        if choice == 1:   edit_personal(tp)
-        elif choice == 2: deps = collect_dependents(); tp["dependents"] = deps
-        elif choice == 3: edit_w2s(w2s)
-        elif choice == 4: edit_other_income(tp)
-        elif choice == 5: edit_adjustments(tp)
-        elif choice == 6: edit_nj_property(tp)
-        elif choice == 7: edit_refund_prefs(tp)
-        elif choice == 8: return
+        if choice == 8:
+            return
+        action = EDIT_MENU.get(choice)
+        if action:
+            action(tp, w2s)
 
 # ---------- engines + main ----------
 
 def load_engines():
+    # Imported on first use (after input is collected); sys.modules caches repeats
     use_stub_fed = os.getenv("USE_STUB_FED", "0") == "1"
     use_stub_nj  = os.getenv("USE_STUB_NJ",  "0") == "1"
     if use_stub_fed:
@@ -514,46 +504,167 @@ def load_engines():
         from engines.compute_nj_full import compute_nj as NJ
     return FED, NJ
 
-def write_json(path: str, data: Dict):
+def write_text(path: str, text: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+        f.write(text)
 
-def main():
+def write_outputs(taxpayer: Dict, w2s: List[Dict], outputs: Dict[str, Dict]):
+    """
+    Write {"inputs", "w2s", "lines"} for each path -> lines in `outputs`.
+    The shared inputs/w2s block is encoded once and spliced into every file;
+    the bytes are identical to json.dumps(full dict, indent=2).
+    """
+    import json  # deferred: the prompt phase doesn't need it
+    # The splice relies on json.dumps' indent=2 layout: a non-empty dict ends
+    # in "\n}", and the only raw newlines are between items (newlines inside
+    # strings are escaped), so "\n" -> "\n  " nests a value one level deeper.
+    shared = json.dumps({"inputs": taxpayer, "w2s": w2s}, indent=2)[:-2]  # drop "\n}"
+    for path, lines in outputs.items():
+        lines_json = json.dumps(lines, indent=2).replace("\n", "\n  ")
+        write_text(path, f'{shared},\n  "lines": {lines_json}\n}}')
+
+def load_session(path: str):
+    """
+    Non-interactive input: load taxpayer + W-2s from a JSON file shaped like
+    the wizard's own output ({"inputs": {...}, "w2s": [...]}).
+    W-2 money boxes, and any taxpayer money fields present, are normalized
+    through set_money ("1,000", "$5", null all work) so the engines, summary
+    math and digit arrays match an interactive run.
+    """
+    import json
+    with open(path, encoding="utf-8") as f:
+        return session_from_dict(json.load(f))
+
+# Taxpayer-level money fields set by the collect_* sections
+TP_MONEY_KEYS = tuple(key for _, fields in OTHER_INCOME_QUESTIONS for key, _ in fields) + (
+    "student_loan_interest", "ira_contributions", "hsa_contributions",
+    "rent_paid", "property_tax_paid",
+)
+
+def _session_money(raw) -> float:
+    if raw is None:
+        return 0.0
+    if isinstance(raw, (int, float)):
+        return raw
+    return _to_float_money(str(raw))
+
+def session_from_dict(data: Dict):
+    if not isinstance(data, dict):
+        raise ValueError('expected a JSON object like {"inputs": {...}, "w2s": [...]}')
+    taxpayer = data.get("inputs", {})
+    w2s = data.get("w2s", [])
+    for key in TP_MONEY_KEYS:
+        if key in taxpayer:
+            raw = taxpayer[key]
+            taxpayer[key] = None  # force fresh digit arrays; never trust the file's
+            set_money(taxpayer, key, _session_money(raw))
+    for w in w2s:
+        for key in W2_MONEY_KEYS:
+            raw = w.get(key, 0.0)
+            w[key] = None
+            set_money(w, key, _session_money(raw))
+    return taxpayer, w2s
+
+def run_batch(path: str):
+    """
+    Non-interactive bulk run: each non-blank line of `path` is one session
+    (same shape as --from). Results are written one JSON object per line to
+    out/batch_f1040.jsonl and out/batch_nj1040.jsonl, in input order.
+    A line that fails to parse or compute is reported as path:lineno and
+    skipped (neither output gets it); the run then exits non-zero.
+    """
+    import json
+    try:
+        src = open(path, encoding="utf-8")  # before the outputs, so they aren't truncated
+    except OSError as e:
+        print(f"{path}: {e}", file=sys.stderr)
+        sys.exit(1)
     FED, NJ = load_engines()
+    os.makedirs("out", exist_ok=True)
+    n = bad = 0
+    with src, \
+         open("out/batch_f1040.jsonl", "w", encoding="utf-8") as fed_out, \
+         open("out/batch_nj1040.jsonl", "w", encoding="utf-8") as nj_out:
+        for lineno, line in enumerate(src, 1):
+            if not line.strip():
+                continue
+            try:
+                taxpayer, w2s = session_from_dict(json.loads(line))
+                # compact dumps of a non-empty dict ends in "}": drop it, append "lines"
+                shared = json.dumps({"inputs": taxpayer, "w2s": w2s})[:-1]  # encode inputs once
+                fed_line = f'{shared}, "lines": {json.dumps(FED(taxpayer, w2s))}}}\n'
+                nj_line  = f'{shared}, "lines": {json.dumps(NJ(taxpayer, w2s))}}}\n'
+            except Exception as e:
+                print(f"{path}:{lineno}: skipped: {type(e).__name__}: {e}", file=sys.stderr)
+                bad += 1
+                continue
+            fed_out.write(fed_line)
+            nj_out.write(nj_line)
+            n += 1
+    print(f"Processed {n} return(s)")
+    print("Wrote out/batch_f1040.jsonl")
+    print("Wrote out/batch_nj1040.jsonl")
+    if bad:
+        print(f"ERROR: {bad} line(s) of {path} were skipped (see above)", file=sys.stderr)
+        sys.exit(1)
 
-    taxpayer = collect_personal_info()
-    taxpayer["dependents"] = collect_dependents()
-    w2s = collect_w2s()
-    collect_other_income(taxpayer)
-    collect_adjustments(taxpayer)
-    collect_nj_property(taxpayer)
-    collect_refund_prefs(taxpayer)
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        if len(sys.argv) < 3:
+            print("Usage: python wizard.py --batch returns.jsonl", file=sys.stderr)
+            sys.exit(2)
+        run_batch(sys.argv[2])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--from":
+        # Scripted run (tests/CI): no prompts, straight to compute
+        if len(sys.argv) < 3:
+            print("Usage: python wizard.py --from session.json", file=sys.stderr)
+            sys.exit(2)
+        try:
+            taxpayer, w2s = load_session(sys.argv[2])
+        except (OSError, ValueError) as e:
+            print(f"{sys.argv[2]}: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        taxpayer = collect_personal_info()
+        taxpayer["dependents"] = collect_dependents()
+        w2s = collect_w2s()
+        collect_other_income(taxpayer)
+        collect_adjustments(taxpayer)
+        collect_nj_property(taxpayer)
+        collect_refund_prefs(taxpayer)
 
-    # Review & edit before computing
-    review_and_edit(taxpayer, w2s)
+        # Review & edit before computing
+        review_and_edit(taxpayer, w2s)
 
+    FED, NJ = load_engines()
     fed_raw = FED(taxpayer, w2s)
     nj_raw  = NJ(taxpayer, w2s)
 
-    write_json("out/out_f1040.json", {"inputs": taxpayer, "w2s": w2s, "lines": fed_raw})
-    write_json("out/out_nj1040.json", {"inputs": taxpayer, "w2s": w2s, "lines": nj_raw})
+    write_outputs(taxpayer, w2s, {"out/out_f1040.json": fed_raw, "out/out_nj1040.json": nj_raw})
+
+    # One pass over the W-2s for all four summary totals
+    wages = fed_wh = nj_wages = nj_wh = 0.0
+    for w in w2s:
+        wages    += w.get("wages", 0)
+        fed_wh   += w.get("federal_withheld", 0)
+        nj_wages += w.get("nj_wages", 0)
+        nj_wh    += w.get("nj_withheld", 0)
 
-    print("\n=== Federal Summary ===")
-    wages   = sum(w.get("wages",0) for w in w2s)
     fed_tax = fed_raw.get("16", 0)
-    fed_wh  = sum(w.get("federal_withheld",0) for w in w2s)
-    print(f"Wages: {wages:,.2f} | Tax: {fed_tax:,.2f} | Withheld: {fed_wh:,.2f} | "
-          f"Refund: {fed_raw.get('34',0):,.2f} | Owed: {fed_raw.get('37',0):,.2f}")
-    print("Wrote out/out_f1040.json")
-
-    print("\n=== NJ Summary ===")
-    nj_wages = sum(w.get("nj_wages",0) for w in w2s)
-    nj_tax   = nj_raw.get("16", 0)
-    nj_wh    = sum(w.get("nj_withheld",0) for w in w2s)
-    print(f"Wages: {nj_wages:,.2f} | Tax: {nj_tax:,.2f} | Withheld: {nj_wh:,.2f} | "
-          f"Refund: {nj_raw.get('65',0):,.2f} | Owed: {nj_raw.get('66',0):,.2f}")
-    print("Wrote out/out_nj1040.json\n")
+    nj_tax  = nj_raw.get("16", 0)
+    sys.stdout.write(
+        "\n=== Federal Summary ===\n"
+        f"Wages: {wages:,.2f} | Tax: {fed_tax:,.2f} | Withheld: {fed_wh:,.2f} | "
+        f"Refund: {fed_raw.get('34',0):,.2f} | Owed: {fed_raw.get('37',0):,.2f}\n"
+        "Wrote out/out_f1040.json\n"
+        "\n=== NJ Summary ===\n"
+        f"Wages: {nj_wages:,.2f} | Tax: {nj_tax:,.2f} | Withheld: {nj_wh:,.2f} | "
+        f"Refund: {nj_raw.get('65',0):,.2f} | Owed: {nj_raw.get('66',0):,.2f}\n"
+        "Wrote out/out_nj1040.json\n\n"
+    )
 
 if __name__ == "__main__":
     try: